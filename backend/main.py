@@ -11,13 +11,16 @@ import socket
 import subprocess
 import re
 import json
+import functools
 from contextlib import asynccontextmanager
+from typing import Optional, Tuple
 
 # 第三方库
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, Response, JSONResponse
+from fastapi.responses import HTMLResponse, Response, JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
 # 固定端口
@@ -65,7 +68,8 @@ app = FastAPI(
     title="跨屏输入API",
     description="统一管理剪贴板操作和页面跳转的后端API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # 所有接口默认使用 orjson 序列化
 )
 
 # 配置CORS
@@ -80,8 +84,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# SSE 事件流路径前缀（旧版 Starlette 的 GZipMiddleware 会缓冲事件流，导致事件无法实时推送）
+SSE_PATH_PREFIX = "/api/monitor/events/"
+
+class NoSSEGZipMiddleware(GZipMiddleware):
+    """跳过 SSE 事件流的 GZip 中间件"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(SSE_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# 压缩较大的响应（HTML页面、前端静态资源）
+app.add_middleware(NoSSEGZipMiddleware, minimum_size=512)
+
 # 从 config.py 导入路径配置
 from config import PROJECT_ROOT, FRONTEND_DIR
+from utils.network_utils import is_private_ip
+
+# 前端页面路径（启动时计算一次）
+DESKTOP_HTML_PATH = os.path.join(FRONTEND_DIR, "desktop.html")
+PHONE_HTML_PATH = os.path.join(FRONTEND_DIR, "phone.html")
+ACTIVATION_HTML_PATH = os.path.join(FRONTEND_DIR, "activation.html")
 
 # 挂载前端静态文件
 if os.path.exists(FRONTEND_DIR):
@@ -103,9 +128,45 @@ app.include_router(desktop_api.router, prefix="/api/desktop", tags=["desktop"])
 app.include_router(machine_id.router, prefix="/api/machine-id", tags=["machine-id"])
 app.include_router(activation.router, prefix="/api/activation", tags=["activation"])
 
+# HTML 页面缓存: {路径: (修改时间, 内容, ETag)}
+_html_cache = {}
+
+
+def read_html(path: str) -> Optional[Tuple[str, str]]:
+    """读取前端HTML页面（文件未修改时直接返回缓存内容），返回 (内容, ETag)，文件不存在返回None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    
+    mtime = stat.st_mtime_ns
+    cached = _html_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    etag = f'"{mtime:x}-{stat.st_size:x}"'
+    _html_cache[path] = (mtime, content, etag)
+    return content, etag
+
+
+def html_page(request: Request, path: str, not_found_html: str) -> Response:
+    """返回HTML页面；浏览器缓存的 ETag 未变化时返回 304"""
+    page = read_html(path)
+    if page is None:
+        return HTMLResponse(content=not_found_html)
+    
+    content, etag = page
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=content, headers=headers)
+
+
 # 根路径返回desktop.html（仅限本机访问）
 @app.get("/", response_class=HTMLResponse)
-async def root(request: Request) -> HTMLResponse:
+async def root(request: Request) -> Response:
     """返回电脑端主页面（仅限127.0.0.1访问）"""
     client_ip = request.client.host
     
@@ -116,43 +177,40 @@ async def root(request: Request) -> HTMLResponse:
             status_code=403
         )
     
-    desktop_html_path = os.path.join(FRONTEND_DIR, "desktop.html")
-    if os.path.exists(desktop_html_path):
-        with open(desktop_html_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        return HTMLResponse(content=content)
-    return HTMLResponse(content="<h1>跨屏输入</h1><p>前端文件未找到</p>")
+    return html_page(
+        request,
+        DESKTOP_HTML_PATH,
+        "<h1>跨屏输入</h1><p>前端文件未找到</p>"
+    )
 
 
 # phone路径返回phone.html
 @app.get("/phone", response_class=HTMLResponse)
-async def phone() -> HTMLResponse:
+async def phone(request: Request) -> Response:
     """返回手机端主页面"""
-    phone_html_path = os.path.join(FRONTEND_DIR, "phone.html")
-    if os.path.exists(phone_html_path):
-        with open(phone_html_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        return HTMLResponse(content=content)
-    return HTMLResponse(content="<h1>跨屏输入</h1><p>前端文件未找到</p>")
+    return html_page(
+        request,
+        PHONE_HTML_PATH,
+        "<h1>跨屏输入</h1><p>前端文件未找到</p>"
+    )
 
 
 # send路径返回phone.html（GET请求）
 @app.get("/send", response_class=HTMLResponse)
-async def send() -> HTMLResponse:
+async def send(request: Request) -> Response:
     """返回手机端主页面（兼容旧路径）"""
-    return await phone()
+    return await phone(request)
 
 
 # activation路径返回activation.html
 @app.get("/activation", response_class=HTMLResponse)
-async def activation() -> HTMLResponse:
+async def activation(request: Request) -> Response:
     """返回激活页面"""
-    activation_html_path = os.path.join(FRONTEND_DIR, "activation.html")
-    if os.path.exists(activation_html_path):
-        with open(activation_html_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        return HTMLResponse(content=content)
-    return HTMLResponse(content="<h1>激活页面未找到</h1><p>前端文件未找到</p>")
+    return html_page(
+        request,
+        ACTIVATION_HTML_PATH,
+        "<h1>激活页面未找到</h1><p>前端文件未找到</p>"
+    )
 
 # 定义请求模型
 class SendRequest(BaseModel):
@@ -164,23 +222,22 @@ class SendRequest(BaseModel):
 @app.post("/send")
 async def send_post(request: Request) -> dict:
     """处理POST请求，复制文本到剪贴板"""
-    from routes.clipboard import copy_to_clipboard
-    
     try:
         body = await request.json()
         copy_data = SendRequest(**body)
         
         # 调用剪贴板功能
-        result = await copy_to_clipboard(request, copy_data)
+        result = await clipboard.copy_to_clipboard(request, copy_data)
         # 转换为字典
-        return result.dict() if hasattr(result, 'dict') else result
+        return result.model_dump() if isinstance(result, BaseModel) else result
     except Exception as e:
         return {
             "status": "error",
             "message": f"处理请求失败: {str(e)}"
         }
 
-# 获取本地IP地址
+# 获取本地IP地址（进程内只探测一次，/health 无需每次都创建套接字）
+@functools.lru_cache(maxsize=1)
 def get_local_ip() -> str:
     """获取本机局域网IP地址"""
     try:
@@ -201,27 +258,6 @@ def get_local_ip() -> str:
         return "localhost"
 
 
-# 检查是否为私有IP
-def is_private_ip(ip: str) -> bool:
-    """检查IP是否在允许的网络范围内（只允许私有网络和本机访问）"""
-    parts = ip.split('.')
-    if len(parts) != 4:
-        return False
-    
-    # 检查 10.0.0.0/8（手机热点网络）
-    if parts[0] == '10':
-        return True
-    # 检查 172.16.0.0/12（私有网络）
-    elif parts[0] == '172' and 16 <= int(parts[1]) <= 31:
-        return True
-    # 检查 192.168.0.0/16（私有网络）
-    elif parts[0] == '192' and parts[1] == '168':
-        return True
-    # 检查 localhost
-    elif ip == '127.0.0.1' or ip == 'localhost':
-        return True
-    return False
-
 # 全局访问控制中间件
 @app.middleware("http")
 async def private_network_only(request: Request, call_next) -> Response:
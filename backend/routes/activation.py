@@ -12,14 +12,15 @@ from pydantic import BaseModel
 from typing import Optional
 import logging
 
-from ..utils.license_manager import (
+from utils.license_manager import (
     get_license_manager,
     activate_license,
     deactivate_license,
     get_activation_info,
-    check_activation
+    check_activation,
+    check_feature_access as has_feature_access
 )
-from ..utils.machine_id import get_machine_code
+from utils.machine_id import get_machine_code
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -178,9 +179,7 @@ async def check_feature_access(feature_name: str):
         功能访问权限状态
     """
     try:
-        from ..utils.license_manager import check_feature_access
-        
-        has_access = check_feature_access(feature_name)
+        has_access = has_feature_access(feature_name)
         
         return {
             "success": True,
@@ -10,7 +10,6 @@ from pydantic import BaseModel, validator, Field
 from typing import List, Optional
 import sys
 import os
-import re
 
 # 添加utils目录到路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,6 +20,7 @@ from utils.shortcut_storage import (
     delete_button,
     get_button_by_id
 )
+from utils.platform_utils import SHORTCUT_PATTERN
 
 router = APIRouter()
 
@@ -49,8 +49,7 @@ class ButtonConfig(BaseModel):
             # 转换为小写格式
             v = v.strip().lower()
             # 验证快捷键格式：ctrl+v, alt+tab, ctrl+up 等（小写格式，支持下划线）
-            pattern = r'^[a-z0-9_]+(\+[a-z0-9_]+)*$'
-            if not re.match(pattern, v):
+            if not SHORTCUT_PATTERN.fullmatch(v):
                 raise ValueError('快捷键格式不正确，必须使用小写字母、数字和下划线，用+分隔，例如：ctrl+v, ctrl+up')
         return v
     
@@ -106,8 +105,7 @@ class ButtonUpdate(BaseModel):
             # 转换为小写格式
             v = v.strip().lower()
             # 验证快捷键格式：ctrl+v, alt+tab, ctrl+up 等（小写格式，支持下划线）
-            pattern = r'^[a-z0-9_]+(\+[a-z0-9_]+)*$'
-            if not re.match(pattern, v):
+            if not SHORTCUT_PATTERN.fullmatch(v):
                 raise ValueError('快捷键格式不正确，必须使用小写字母、数字和下划线，用+分隔，例如：ctrl+v, ctrl+up')
         return v
     
@@ -135,7 +133,7 @@ class ButtonResponse(BaseModel):
 
 # API端点
 @router.get("/list", response_model=ButtonListResponse)
-async def get_button_list():
+def get_button_list():
     """获取所有按钮列表"""
     try:
         buttons = load_buttons()
@@ -151,10 +149,10 @@ async def get_button_list():
         )
 
 @router.post("/add", response_model=ButtonResponse)
-async def add_button_config(button: ButtonConfig):
+def add_button_config(button: ButtonConfig):
     """添加新按钮"""
     try:
-        button_data = button.dict(exclude_none=True)
+        button_data = button.model_dump(exclude_none=True)
         
         # 根据类型清理不需要的字段
         button_type = button_data.get("type")
@@ -182,7 +180,7 @@ async def add_button_config(button: ButtonConfig):
         )
 
 @router.put("/update/{button_id}", response_model=ButtonResponse)
-async def update_button_config(button_id: str, button: ButtonUpdate):
+def update_button_config(button_id: str, button: ButtonUpdate):
     """更新按钮"""
     try:
         # 检查按钮是否存在
@@ -194,7 +192,7 @@ async def update_button_config(button_id: str, button: ButtonUpdate):
             )
         
         # 更新按钮
-        button_data = button.dict(exclude_none=True)
+        button_data = button.model_dump(exclude_none=True)
         
         # 确定新的类型（如果提供了type则使用新的，否则使用原有的）
         new_type = button_data.get("type", existing_button.get("type"))
@@ -232,7 +230,7 @@ async def update_button_config(button_id: str, button: ButtonUpdate):
         )
 
 @router.delete("/delete/{button_id}")
-async def delete_button_config(button_id: str):
+def delete_button_config(button_id: str):
     """删除按钮"""
     try:
         # 检查按钮是否存在
@@ -265,7 +263,7 @@ async def delete_button_config(button_id: str):
         )
 
 @router.get("/get/{button_id}", response_model=ButtonResponse)
-async def get_button_config(button_id: str):
+def get_button_config(button_id: str):
     """获取单个按钮"""
     try:
         button = get_button_by_id(button_id)
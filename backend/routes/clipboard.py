@@ -9,6 +9,8 @@ from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 import pyperclip
 
+from utils.license_manager import check_activation
+
 # 创建路由器实例
 router = APIRouter()
 
@@ -27,7 +29,6 @@ async def copy_to_clipboard(request: Request, copy_data: CopyRequest):
     """复制文本到剪贴板"""
     try:
         # === 激活检查开始 ===
-        from ..utils.license_manager import check_activation
         if not check_activation():
             raise HTTPException(
                 status_code=403,
@@ -55,10 +56,10 @@ async def copy_to_clipboard(request: Request, copy_data: CopyRequest):
         # 复制到剪贴板
         pyperclip.copy(text)
         
-        return CopyResponse(
-            status="success",
-            message="Copied to clipboard"
-        )
+        return {
+            "status": "success",
+            "message": "Copied to clipboard"
+        }
         
     except HTTPException:
         raise
@@ -6,19 +6,66 @@
 """
 
 import os
+import platform
 import socket
 import subprocess
 import re
+import threading
+import time
+from datetime import datetime
 from fastapi import APIRouter
 from typing import Dict, Any, Optional
 
+import psutil
+
 from utils.logger import app_logger
+from utils.network_utils import ip_to_int, private_network_rank
+from routes.mouse_listener import is_listener_running
 
 router = APIRouter()
 
+# IP 探测结果缓存时间（秒），避免轮询接口每次都执行 ifconfig/ipconfig
+IP_CACHE_TTL = 5.0
+
+# IP 缓存: {函数名: (值, 过期时间)}
+_ip_cache = {}
+_ip_cache_lock = threading.Lock()
+
+
+# 状态接口时间戳缓存: (整秒, ISO时间字符串)，同一秒内的请求复用同一字符串
+_timestamp_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """返回当前时间的ISO字符串（精确到秒，同一秒内不重复格式化）"""
+    global _timestamp_cache
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != now:
+        cached = (now, datetime.fromtimestamp(now).isoformat())
+        _timestamp_cache = cached
+    return cached[1]
+
+
+def _cached_ip(name: str, probe):
+    """在 IP_CACHE_TTL 内返回缓存的探测结果，过期后重新探测"""
+    now = time.monotonic()
+    with _ip_cache_lock:
+        cached = _ip_cache.get(name)
+        if cached and now < cached[1]:
+            return cached[0]
+        value = probe()
+        _ip_cache[name] = (value, now + IP_CACHE_TTL)
+        return value
+
 
 def get_local_ip() -> str:
-    """获取本机局域网IP地址"""
+    """获取本机局域网IP地址（带缓存）"""
+    return _cached_ip("local_ip", _probe_local_ip)
+
+
+def _probe_local_ip() -> str:
+    """探测本机局域网IP地址"""
     try:
         # 使用私有网络地址来获取本地IP，避免使用公共DNS
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -30,43 +77,73 @@ def get_local_ip() -> str:
         return "localhost"
 
 
+# 命令输出解析用的预编译正则（与 network_utils 中私有网络段的优先级顺序一致）
+_PRIVATE_IP_REGEXES = (
+    r'10\.\d+\.\d+\.\d+',
+    r'172\.(?:1[6-9]|2\d|3[01])\.\d+\.\d+',
+    r'192\.168\.\d+\.\d+',
+)
+_IFCONFIG_PATTERNS = tuple(re.compile(rf'inet\s+({r})') for r in _PRIVATE_IP_REGEXES)
+_IPCONFIG_PATTERNS = tuple(re.compile(rf'(?:IPv4 Address|IPv4 地址)[\s:.]+({r})') for r in _PRIVATE_IP_REGEXES)
+_BARE_IP_PATTERNS = tuple(re.compile(f'({r})') for r in _PRIVATE_IP_REGEXES)
+
+
 def get_private_ip() -> Optional[str]:
-    """获取私有网络IP地址"""
+    """获取私有网络IP地址（带缓存）"""
+    return _cached_ip("private_ip", _probe_private_ip)
+
+
+def _probe_private_ip() -> Optional[str]:
+    """探测私有网络IP地址（优先直接读取网卡信息，读取失败时解析系统命令输出）"""
+    try:
+        candidates = []
+        for addrs in psutil.net_if_addrs().values():
+            for addr in addrs:
+                if addr.family == socket.AF_INET:
+                    value = ip_to_int(addr.address)
+                    rank = private_network_rank(value) if value is not None else None
+                    if rank is not None:
+                        candidates.append((rank, addr.address))
+        
+        if not candidates:
+            return None
+        # 返回优先级最高的网段中第一个找到的私有网络IP
+        return min(candidates, key=lambda c: c[0])[1]
+    except Exception as e:
+        app_logger.error(f"读取网卡信息失败，改用系统命令: {e}", "desktop_api")
+        return _probe_private_ip_by_command()
+
+
+def _first_match(patterns, text: str) -> Optional[str]:
+    """按优先级依次搜索，返回第一个匹配到的IP"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _probe_private_ip_by_command() -> Optional[str]:
+    """通过 ifconfig/ipconfig 命令输出探测私有网络IP地址"""
     try:
-        import platform
         system = platform.system()
-        private_ips = []
         
         if system == 'Darwin':
             # macOS使用ifconfig命令
             result = subprocess.run(['ifconfig'], capture_output=True, text=True)
             # 查找私有网络IP地址
-            private_ips = re.findall(r'inet\s+(10\.\d+\.\d+\.\d+)', result.stdout)
-            private_ips.extend(re.findall(r'inet\s+(172\.(?:1[6-9]|2\d|3[01])\.\d+\.\d+)', result.stdout))
-            private_ips.extend(re.findall(r'inet\s+(192\.168\.\d+\.\d+)', result.stdout))
+            return _first_match(_IFCONFIG_PATTERNS, result.stdout)
         elif system == 'Linux':
             # Linux使用ifconfig命令
             result = subprocess.run(['ifconfig'], capture_output=True, text=True)
             # 查找私有网络IP地址
-            private_ips = re.findall(r'inet\s+(10\.\d+\.\d+\.\d+)', result.stdout)
-            private_ips.extend(re.findall(r'inet\s+(172\.(?:1[6-9]|2\d|3[01])\.\d+\.\d+)', result.stdout))
-            private_ips.extend(re.findall(r'inet\s+(192\.168\.\d+\.\d+)', result.stdout))
+            return _first_match(_IFCONFIG_PATTERNS, result.stdout)
         else:
             # Windows使用ipconfig命令（支持中英文输出）
             result = subprocess.run(['ipconfig'], capture_output=True, text=True, shell=True)
-            # 查找私有网络IP地址，兼容中英文输出
-            private_ips = re.findall(r'(?:IPv4 Address|IPv4 地址)[\s:.]+(10\.\d+\.\d+\.\d+)', result.stdout)
-            private_ips.extend(re.findall(r'(?:IPv4 Address|IPv4 地址)[\s:.]+(172\.(?:1[6-9]|2\d|3[01])\.\d+\.\d+)', result.stdout))
-            private_ips.extend(re.findall(r'(?:IPv4 Address|IPv4 地址)[\s:.]+(192\.168\.\d+\.\d+)', result.stdout))
-            # 如果没有找到，尝试其他格式
-            if not private_ips:
-                private_ips = re.findall(r'(10\.\d+\.\d+\.\d+)', result.stdout)
-                private_ips.extend(re.findall(r'(172\.(?:1[6-9]|2\d|3[01])\.\d+\.\d+)', result.stdout))
-                private_ips.extend(re.findall(r'(192\.168\.\d+\.\d+)', result.stdout))
-        
-        if private_ips:
-            return private_ips[0]  # 返回第一个找到的私有网络IP
-        return None
+            # 查找私有网络IP地址，兼容中英文输出；如果没有找到，尝试其他格式
+            return (_first_match(_IPCONFIG_PATTERNS, result.stdout)
+                    or _first_match(_BARE_IP_PATTERNS, result.stdout))
     except Exception as e:
         app_logger.error(f"获取私有网络IP失败: {e}", "desktop_api")
         return None
@@ -83,7 +160,7 @@ def get_server_port() -> int:
 
 
 @router.get("/access-info")
-async def get_access_info() -> Dict[str, Any]:
+def get_access_info() -> Dict[str, Any]:
     """
     获取访问信息
     
@@ -129,7 +206,7 @@ async def get_access_info() -> Dict[str, Any]:
 
 
 @router.get("/status")
-async def get_status() -> Dict[str, Any]:
+def get_status() -> Dict[str, Any]:
     """
     获取服务状态
     
@@ -144,21 +221,11 @@ async def get_status() -> Dict[str, Any]:
         port = get_server_port()
         hotspot_ip = get_hotspot_ip()
         
-        # 检查端口是否被占用（服务器是否运行）
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(0.1)
-                result = sock.connect_ex(('localhost', port))
-                server_running = result == 0
-        except:
-            server_running = False
+        # 能处理本请求说明服务器正在运行，无需再连接自身端口探测
+        server_running = True
         
         # 检查鼠标监听器状态
-        try:
-            from routes.mouse_listener import is_listener_running
-            mouse_listener_status = is_listener_running()
-        except:
-            mouse_listener_status = False
+        mouse_listener_status = is_listener_running()
         
         app_logger.info(f"返回状态信息: server_running={server_running}, mouse_listener={mouse_listener_status}", "desktop_api")
         
@@ -168,7 +235,7 @@ async def get_status() -> Dict[str, Any]:
             "hotspot_connected": hotspot_ip is not None,
             "hotspot_ip": hotspot_ip,
             "mouse_listener_status": mouse_listener_status,
-            "timestamp": app_logger._create_entry("INFO", "", "desktop_api")["timestamp"]
+            "timestamp": _now_iso()
         }
     except Exception as e:
         app_logger.error(f"获取状态信息失败: {e}", "desktop_api")
@@ -12,7 +12,7 @@ from pydantic import BaseModel
 from typing import Dict, Any
 import logging
 
-from ..utils.machine_id import get_machine_code, collect_hardware_info, verify_machine_code
+from utils.machine_id import get_machine_code, collect_hardware_info, verify_machine_code
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
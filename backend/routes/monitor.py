@@ -41,14 +41,14 @@ def on_clipboard_change(button_id: str) -> None:
     """剪贴板变化回调（从轮询线程调用）"""
     info(f"🔔 剪贴板变化回调触发: {button_id}", source="monitor_api")
     
-    # 将事件放入队列
-    if button_id not in button_events:
+    # 将事件放入队列（只取一次，避免检查后被事件循环线程删除）
+    queue = button_events.get(button_id)
+    if queue is None:
         error(f"按钮 {button_id} 的事件队列不存在", source="monitor_api")
         return
     
     try:
         event_data = {"type": "clipboard_change", "button_id": button_id}
-        queue = button_events[button_id]
         
         # 使用线程安全的方式添加事件
         if main_event_loop and main_event_loop.is_running():
@@ -109,8 +109,7 @@ async def control_monitor(request: MonitorRequest) -> MonitorResponse:
         clipboard_monitor.stop_monitoring(button_id)
         
         # 清理事件队列
-        if button_id in button_events:
-            del button_events[button_id]
+        button_events.pop(button_id, None)
         
         return MonitorResponse(
             status="success",
@@ -9,14 +9,14 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from pynput.mouse import Button, Controller as MouseController
 from pynput.keyboard import Key, Controller as KeyboardController
-import re
 import sys
 import os
 
 # 添加utils目录到路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import info, error
-from utils.platform_utils import get_platform, CURRENT_PLATFORM, MODIFIER_KEY_MAP
+from utils.platform_utils import get_platform, CURRENT_PLATFORM, MODIFIER_KEY_MAP, SHORTCUT_PATTERN
+from utils.license_manager import check_activation
 
 # 创建路由器实例
 router = APIRouter()
@@ -60,8 +60,7 @@ def parse_mouse_action(action_str):
     action_str = action_str.strip().lower()
     
     # 验证格式：必须是小写字母、数字和下划线，用+分隔
-    pattern = r'^[a-z0-9_]+(\+[a-z0-9_]+)*$'
-    if not re.match(pattern, action_str):
+    if not SHORTCUT_PATTERN.fullmatch(action_str):
         raise ValueError(f"鼠标操作格式不正确，必须使用小写字母、数字和下划线，用+分隔，例如：left，当前输入：{action_str}")
     
     parts = action_str.split('+')
@@ -198,7 +197,6 @@ async def execute_mouse_endpoint(request: MouseRequest):
     """执行鼠标操作"""
     try:
         # === 激活检查开始 ===
-        from ..utils.license_manager import check_activation
         if not check_activation():
             raise HTTPException(
                 status_code=403,
@@ -224,10 +222,10 @@ async def execute_mouse_endpoint(request: MouseRequest):
         
         info(f"鼠标操作执行成功: {action_str}")
         
-        return MouseResponse(
-            status="success",
-            message="鼠标操作执行成功"
-        )
+        return {
+            "status": "success",
+            "message": "鼠标操作执行成功"
+        }
     except ValueError as e:
         error(f"鼠标操作执行失败 (ValueError): {str(e)}")
         raise HTTPException(
@@ -8,7 +8,6 @@
 # 标准库
 import sys
 import os
-import re
 import json
 from datetime import datetime
 from typing import List, Optional
@@ -22,6 +21,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # 导入配置
 from config import DATA_DIR
+from utils.platform_utils import SHORTCUT_PATTERN
 
 router = APIRouter()
 
@@ -134,6 +134,10 @@ def update_button(button_id: str, button_data: dict) -> Optional[dict]:
     
     for i, button in enumerate(buttons):
         if button.get("id") == button_id:
+            # 内容没有变化时直接返回，不重写配置文件
+            if all(button.get(key) == value for key, value in button_data.items()):
+                return button
+            
             updated_button = {**button, **button_data}
             updated_button["updated_at"] = datetime.now().isoformat()
             updated_button["id"] = button_id  # 确保ID不变
@@ -184,8 +188,7 @@ class MouseButtonConfig(BaseModel):
         # 转换为小写格式
         v = v.strip().lower()
         # 验证快捷键格式：ctrl+v 或系统命令如 launchpad, mission_control 等
-        pattern = r'^[a-z0-9_]+(\+[a-z0-9_]+)*$'
-        if not re.match(pattern, v):
+        if not SHORTCUT_PATTERN.fullmatch(v):
             raise ValueError('快捷键格式不正确，必须使用小写字母、数字和下划线，用+分隔，例如：ctrl+v 或 launchpad')
         return v
     
@@ -225,8 +228,7 @@ class MouseButtonUpdate(BaseModel):
             # 转换为小写格式
             v = v.strip().lower()
             # 验证快捷键格式：ctrl+v 或系统命令如 launchpad, mission_control 等
-            pattern = r'^[a-z0-9_]+(\+[a-z0-9_]+)*$'
-            if not re.match(pattern, v):
+            if not SHORTCUT_PATTERN.fullmatch(v):
                 raise ValueError('快捷键格式不正确，必须使用小写字母、数字和下划线，用+分隔，例如：ctrl+v 或 launchpad')
         return v
     
@@ -257,7 +259,7 @@ class MouseButtonResponse(BaseModel):
 
 # API端点
 @router.get("/list", response_model=MouseButtonListResponse)
-async def get_mouse_button_list():
+def get_mouse_button_list():
     """获取所有鼠标按钮列表"""
     try:
         buttons = load_buttons()
@@ -273,10 +275,10 @@ async def get_mouse_button_list():
         )
 
 @router.post("/add", response_model=MouseButtonResponse)
-async def add_mouse_button_config(button: MouseButtonConfig):
+def add_mouse_button_config(button: MouseButtonConfig):
     """添加新鼠标按钮"""
     try:
-        button_data = button.dict(exclude_none=True)
+        button_data = button.model_dump(exclude_none=True)
         new_button = add_button(button_data)
         
         # 重新加载映射并重启监听器
@@ -300,7 +302,7 @@ async def add_mouse_button_config(button: MouseButtonConfig):
         )
 
 @router.put("/update/{button_id}", response_model=MouseButtonResponse)
-async def update_mouse_button_config(button_id: str, button: MouseButtonUpdate):
+def update_mouse_button_config(button_id: str, button: MouseButtonUpdate):
     """更新鼠标按钮"""
     try:
         # 检查按钮是否存在
@@ -312,7 +314,7 @@ async def update_mouse_button_config(button_id: str, button: MouseButtonUpdate):
             )
         
         # 更新按钮
-        button_data = button.dict(exclude_none=True)
+        button_data = button.model_dump(exclude_none=True)
         updated_button = update_button(button_id, button_data)
         
         if not updated_button:
@@ -321,14 +323,15 @@ async def update_mouse_button_config(button_id: str, button: MouseButtonUpdate):
                 detail="更新鼠标按钮失败"
             )
         
-        # 重新加载映射并重启监听器
-        try:
-            from routes.mouse_listener import reload_and_restart_listener
-            reload_and_restart_listener()
-        except Exception as e:
-            # 如果重启监听器失败，不影响按钮更新的成功返回
-            import logging
-            logging.warning(f"重启监听器失败: {e}")
+        # 重新加载映射并重启监听器（按钮未变化、updated_at 未更新时跳过）
+        if updated_button.get("updated_at") != existing_button.get("updated_at"):
+            try:
+                from routes.mouse_listener import reload_and_restart_listener
+                reload_and_restart_listener()
+            except Exception as e:
+                # 如果重启监听器失败，不影响按钮更新的成功返回
+                import logging
+                logging.warning(f"重启监听器失败: {e}")
         
         return MouseButtonResponse(
             status="success",
@@ -344,7 +347,7 @@ async def update_mouse_button_config(button_id: str, button: MouseButtonUpdate):
         )
 
 @router.delete("/delete/{button_id}")
-async def delete_mouse_button_config(button_id: str):
+def delete_mouse_button_config(button_id: str):
     """删除鼠标按钮"""
     try:
         # 检查按钮是否存在
@@ -386,7 +389,7 @@ async def delete_mouse_button_config(button_id: str):
         )
 
 @router.get("/get/{button_id}", response_model=MouseButtonResponse)
-async def get_mouse_button_config(button_id: str):
+def get_mouse_button_config(button_id: str):
     """获取单个鼠标按钮"""
     try:
         button = get_button_by_id(button_id)
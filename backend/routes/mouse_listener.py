@@ -8,8 +8,10 @@ Windows 专用版本（使用 Windows API 钩子）
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, NamedTuple
+import functools
 import threading
+from collections import deque
 import sys
 import os
 import platform
@@ -21,6 +23,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # 导入日志模块
 from utils.logger import app_logger
+from routes.mouse_config import load_buttons
 
 from pynput.keyboard import Key, Controller as KeyboardController
 from pynput.mouse import Button
@@ -30,6 +33,19 @@ router = APIRouter()
 # 键盘控制器
 keyboard_controller = KeyboardController()
 
+# pynput 鼠标按键到统一按键类型的映射（非 Windows 监听使用；部分平台没有侧键）
+_PYNPUT_BUTTON_MAP = {
+    getattr(Button, name): button_type
+    for name, button_type in (
+        ('left', 'left'),
+        ('right', 'right'),
+        ('middle', 'middle'),
+        ('x1', 'side1'),
+        ('x2', 'side2'),
+    )
+    if hasattr(Button, name)
+}
+
 # 监听器状态
 listener_thread = None
 is_listening = False
@@ -39,17 +55,28 @@ is_windows = platform.system() == 'Windows'
 has_permission = None  # None=未检测, True=有权限, False=无权限
 permission_message = ""
 
+class SeqMap(NamedTuple):
+    """序列映射（元组存储，属性访问比字典查找更快）"""
+    sequence: tuple  # 按键序列，如 ('side1', 'side2')
+    action: str
+    name: str
+
 # 鼠标按键映射
 button_mappings = {}  # 单键映射: {keyType: action}
-sequence_mappings = []  # 序列映射: [{sequence: [key1, key2], action: action}, ...]
+sequence_mappings = []  # 序列映射: [SeqMap(sequence, action, name), ...]
+resolved_actions = {}  # 预解析的动作: {action: ('command', key) 或 ('keys', modifiers, main_key)}
+sequence_trie = {}  # 序列前缀树: {key1: {key2: {_SEQ_ACTION: action}}}
+_SEQ_ACTION = '$action'  # 前缀树中标记完整序列动作的键
 
 # 按键序列检测相关
 import time
-key_history = []  # 按键历史: [(key_type, timestamp), ...]
+KEY_HISTORY_SIZE = 20  # 按键历史最大长度
+key_history = deque(maxlen=KEY_HISTORY_SIZE)  # 按键历史: [(key_type, timestamp), ...]
 SEQUENCE_TIMEOUT = 0.5  # 序列超时时间（秒）
 SINGLE_KEY_DELAY = 0.3  # 单键延迟时间（秒），等待可能的后续按键
-pending_single_key = None  # 待处理的单键: (key_type, action, timestamp)
-pending_timer = None  # 待处理的定时器
+pending_single_key = None  # 待处理的单键: (key_type, action, 执行时间)
+_pending_cond = threading.Condition()  # 保护 pending_single_key 并唤醒延迟执行线程
+_pending_worker = None  # 常驻的单键延迟执行线程（首次使用时启动）
 
 # Windows API 钩子相关
 if is_windows:
@@ -110,45 +137,60 @@ if is_windows:
 
 def load_mappings():
     """从配置文件加载鼠标按键映射（支持单键和序列）"""
-    global button_mappings, sequence_mappings
+    global button_mappings, sequence_mappings, resolved_actions, sequence_trie
     try:
-        from routes.mouse_config import load_buttons
         buttons = load_buttons()
-        button_mappings = {}
-        sequence_mappings = []
+        # 先在局部变量中构建，最后整体替换，避免监听线程读到空的或不完整的映射
+        new_button_mappings = {}
+        new_sequence_mappings = []
+        resolved = {}
         
         for btn in buttons:
             action = btn.get('action')
             if not action:
                 continue
+            
+            # 预先解析动作，点击时无需再解析
+            resolved[action] = _resolve_action(action)
                 
             # 检查是否是序列配置
             sequence = btn.get('sequence')
             if sequence and isinstance(sequence, list) and len(sequence) > 0:
                 # 序列映射
-                sequence_mappings.append({
-                    'sequence': sequence,
-                    'action': action,
-                    'name': btn.get('name', '')
-                })
+                new_sequence_mappings.append(SeqMap(tuple(sequence), action, btn.get('name', '')))
             else:
                 # 单键映射（向后兼容）
                 key_type = btn.get('keyType')
                 if key_type:
-                    button_mappings[key_type] = action
+                    new_button_mappings[key_type] = action
         
         # 按序列长度降序排序（长序列优先匹配）
-        sequence_mappings.sort(key=lambda x: len(x['sequence']), reverse=True)
+        new_sequence_mappings.sort(key=lambda x: len(x.sequence), reverse=True)
+        new_trie = _build_sequence_trie(new_sequence_mappings)
+        
+        resolved_actions = resolved
+        sequence_trie = new_trie
+        sequence_mappings = new_sequence_mappings
+        button_mappings = new_button_mappings
         
         app_logger.info(f"加载了 {len(button_mappings)} 个单键映射: {button_mappings}", source="mouse_listener")
-        app_logger.info(f"加载了 {len(sequence_mappings)} 个序列映射: {[m['sequence'] for m in sequence_mappings]}", source="mouse_listener")
+        app_logger.info(f"加载了 {len(sequence_mappings)} 个序列映射: {[m.sequence for m in sequence_mappings]}", source="mouse_listener")
     except Exception as e:
         app_logger.error(f"加载映射失败: {e}", source="mouse_listener")
         button_mappings = {}
         sequence_mappings = []
-
-# 预解析的快捷键缓存，避免每次都解析
-_shortcut_cache = {}
+        resolved_actions = {}
+        sequence_trie = {}
+
+def _build_sequence_trie(mappings: list) -> dict:
+    """根据序列映射构建前缀树（相同序列保留先出现的动作）"""
+    trie = {}
+    for mapping in mappings:
+        node = trie
+        for key in mapping.sequence:
+            node = node.setdefault(key, {})
+        node.setdefault(_SEQ_ACTION, mapping.action)
+    return trie
 
 # 修饰键映射（Windows 专用）
 _modifier_map = {
@@ -233,11 +275,9 @@ def execute_system_command(command_key: str) -> bool:
     except:
         return False
 
+@functools.lru_cache(maxsize=256)
 def _parse_shortcut(shortcut: str):
-    """解析快捷键（带缓存）"""
-    if shortcut in _shortcut_cache:
-        return _shortcut_cache[shortcut]
-    
+    """解析快捷键（带缓存），返回 (修饰键元组, 主键)"""
     keys = shortcut.lower().split('+')
     modifiers = []
     main_key = None
@@ -250,37 +290,51 @@ def _parse_shortcut(shortcut: str):
         else:
             main_key = _special_keys.get(k, k)
     
-    result = (modifiers, main_key)
-    _shortcut_cache[shortcut] = result
-    return result
+    return tuple(modifiers), main_key
+
+def _resolve_action(action: str) -> tuple:
+    """将动作字符串解析为可直接执行的形式"""
+    action = action.strip().lower()
+    
+    # 先检查是否是系统命令
+    if action in _system_commands or action in _shell_commands:
+        return ('command', action)
+    
+    modifiers, main_key = _parse_shortcut(action)
+    return ('keys', modifiers, main_key)
+
+def execute_parsed(resolved: tuple):
+    """执行预解析的动作（无日志，直接执行）"""
+    if resolved[0] == 'command':
+        execute_system_command(resolved[1])
+        return
+    
+    _, modifiers, main_key = resolved
+    if main_key is None:
+        return
+    
+    # 按下修饰键
+    for mod in modifiers:
+        keyboard_controller.press(mod)
+    
+    # 按下并释放主键
+    keyboard_controller.press(main_key)
+    keyboard_controller.release(main_key)
+    
+    # 释放修饰键
+    for mod in reversed(modifiers):
+        keyboard_controller.release(mod)
 
 def execute_shortcut_fast(shortcut: str):
-    """快速执行快捷键或系统命令（无日志，直接执行）"""
+    """快速执行快捷键或系统命令（成功时不记日志，仅失败时记录）"""
     try:
-        shortcut = shortcut.strip().lower()
-        
-        # 先检查是否是系统命令
-        if shortcut in _system_commands or shortcut in _shell_commands:
-            execute_system_command(shortcut)
-            return
-        
-        modifiers, main_key = _parse_shortcut(shortcut)
-        if main_key is None:
-            return
-        
-        # 按下修饰键
-        for mod in modifiers:
-            keyboard_controller.press(mod)
-        
-        # 按下并释放主键
-        keyboard_controller.press(main_key)
-        keyboard_controller.release(main_key)
-        
-        # 释放修饰键
-        for mod in reversed(modifiers):
-            keyboard_controller.release(mod)
-    except:
-        pass
+        # 优先使用 load_mappings 时预解析的结果，未命中时（如热重载中的新动作）再解析
+        resolved = resolved_actions.get(shortcut)
+        if resolved is None:
+            resolved = _resolve_action(shortcut)
+        execute_parsed(resolved)
+    except Exception as e:
+        app_logger.error(f"执行快捷键失败: {shortcut}, 错误: {e}", source="mouse_listener")
 
 def execute_shortcut(shortcut: str):
     """执行快捷键或系统命令（带日志，用于调试）"""
@@ -324,54 +378,69 @@ def check_sequence_match(history: list) -> tuple:
     if not history:
         return None, False
     
-    history_keys = [h[0] for h in history]
-    matched_action = None
-    is_prefix = False
-    
-    for mapping in sequence_mappings:
-        seq = mapping['sequence']
-        action = mapping['action']
-        
-        # 完全匹配
-        if history_keys == seq:
-            matched_action = action
-            break
-        
-        # 检查是否是前缀
-        if len(history_keys) < len(seq) and seq[:len(history_keys)] == history_keys:
-            is_prefix = True
+    # 沿前缀树逐键查找，复杂度只与历史长度有关
+    node = sequence_trie
+    for key, _ in history:
+        node = node.get(key)
+        if node is None:
+            return None, False
     
+    matched_action = node.get(_SEQ_ACTION)
+    is_prefix = len(node) > (0 if matched_action is None else 1)
     return matched_action, is_prefix
 
 def execute_pending_single_key():
-    """执行待处理的单键操作"""
-    global pending_single_key, pending_timer
+    """执行到期的待处理单键操作"""
+    global pending_single_key
     
-    if pending_single_key:
-        key_type, action, _ = pending_single_key
-        app_logger.info(f"执行单键操作: {key_type} -> {action}", source="mouse_listener")
-        execute_shortcut_fast(action)
+    with _pending_cond:
+        # 已被取消，或已被新的单键替换且尚未到期
+        if pending_single_key is None or pending_single_key[2] > time.monotonic():
+            return
+        action = pending_single_key[1]
         pending_single_key = None
     
-    pending_timer = None
+    execute_shortcut_fast(action)
 
 def cancel_pending_single_key():
     """取消待处理的单键操作"""
-    global pending_single_key, pending_timer
+    global pending_single_key
     
-    if pending_timer:
-        pending_timer.cancel()
-        pending_timer = None
-    pending_single_key = None
+    with _pending_cond:
+        pending_single_key = None
+
+def _pending_worker_loop():
+    """单键延迟执行线程：等待待处理单键到期后执行，避免每次点击都创建定时器线程"""
+    while True:
+        with _pending_cond:
+            while True:
+                if pending_single_key is None:
+                    _pending_cond.wait()
+                    continue
+                remaining = pending_single_key[2] - time.monotonic()
+                if remaining <= 0:
+                    break
+                _pending_cond.wait(remaining)
+        execute_pending_single_key()
+
+def schedule_pending_single_key(key_type: str, action: str, delay: float):
+    """设置延迟执行的单键操作（替换之前待处理的单键）"""
+    global pending_single_key, _pending_worker
+    
+    with _pending_cond:
+        pending_single_key = (key_type, action, time.monotonic() + delay)
+        if _pending_worker is None:
+            _pending_worker = threading.Thread(target=_pending_worker_loop, daemon=True)
+            _pending_worker.start()
+        _pending_cond.notify()
 
 def handle_mouse_button(button_type: str) -> bool:
     """处理鼠标按键事件，返回是否已处理（用于决定是否阻止系统默认行为）"""
-    global key_history, pending_single_key, pending_timer
-    
-    current_time = time.time()
+    current_time = time.monotonic()
     
-    # 清理过期的按键历史
-    key_history = [(k, t) for k, t in key_history if current_time - t < SEQUENCE_TIMEOUT]
+    # 清理过期的按键历史（按时间顺序追加，只需从队首弹出）
+    while key_history and current_time - key_history[0][1] >= SEQUENCE_TIMEOUT:
+        key_history.popleft()
     
     # 添加当前按键到历史
     key_history.append((button_type, current_time))
@@ -383,9 +452,8 @@ def handle_mouse_button(button_type: str) -> bool:
         if matched_action:
             # 完全匹配序列，取消待处理的单键，执行序列动作
             cancel_pending_single_key()
-            app_logger.info(f"序列匹配: {[h[0] for h in key_history]} -> {matched_action}", source="mouse_listener")
             execute_shortcut_fast(matched_action)
-            key_history = []  # 清空历史
+            key_history.clear()  # 清空历史
             return True
         
         if is_prefix:
@@ -395,10 +463,7 @@ def handle_mouse_button(button_type: str) -> bool:
             # 如果当前按键有单键映射，设置延迟执行
             if button_type in button_mappings:
                 action = button_mappings[button_type]
-                pending_single_key = (button_type, action, current_time)
-                pending_timer = threading.Timer(SINGLE_KEY_DELAY, execute_pending_single_key)
-                pending_timer.start()
-                app_logger.info(f"按键 {button_type} 可能是序列前缀，延迟 {SINGLE_KEY_DELAY}s 执行单键操作", source="mouse_listener")
+                schedule_pending_single_key(button_type, action, SINGLE_KEY_DELAY)
             
             return True  # 阻止默认行为，等待序列完成
     
@@ -409,7 +474,7 @@ def handle_mouse_button(button_type: str) -> bool:
         
         shortcut = button_mappings[button_type]
         execute_shortcut_fast(shortcut)
-        key_history = []  # 执行后清空历史
+        key_history.clear()  # 执行后清空历史
         return True
     
     return False  # 未处理，让系统继续处理
@@ -497,15 +562,7 @@ def _run_windows_listener():
                     return  # 只处理按下事件
                 
                 # 映射鼠标按键到统一格式
-                button_map = {
-                    Button.left: 'left',
-                    Button.right: 'right',
-                    Button.middle: 'middle',
-                    Button.x1: 'side1',
-                    Button.x2: 'side2',
-                }
-                
-                button_type = button_map.get(button)
+                button_type = _PYNPUT_BUTTON_MAP.get(button)
                 if button_type:
                     # 检查该按键是否已配置
                     if button_type in button_mappings:
@@ -603,6 +660,14 @@ def is_listener_running():
     """检查监听器是否正在运行"""
     return is_listening
 
+def reload_and_restart_listener():
+    """配置变更后刷新映射（钩子回调每次读取模块级映射，运行中的监听器无需重启）"""
+    load_mappings()
+
+def _sequence_mappings_payload() -> list:
+    """序列映射转为字典列表（保持接口返回格式不变）"""
+    return [m._asdict() for m in sequence_mappings]
+
 def reload_mappings():
     """重新加载按键映射"""
     load_mappings()
@@ -610,17 +675,17 @@ def reload_mappings():
         'success': True,
         'message': '按键映射已重新加载',
         'button_mappings': button_mappings,
-        'sequence_mappings': sequence_mappings
+        'sequence_mappings': _sequence_mappings_payload()
     }
 
 # API 端点
 @router.post("/start")
-async def api_start_listener():
+def api_start_listener():
     """启动鼠标监听器"""
     return start_listener()
 
 @router.post("/stop")
-async def api_stop_listener():
+def api_stop_listener():
     """停止鼠标监听器"""
     return stop_listener()
 
@@ -636,7 +701,7 @@ async def api_get_status():
     }
 
 @router.post("/reload")
-async def api_reload_mappings():
+def api_reload_mappings():
     """重新加载按键映射"""
     return reload_mappings()
 
@@ -645,7 +710,7 @@ async def api_get_mappings():
     """获取当前按键映射"""
     return {
         'button_mappings': button_mappings,
-        'sequence_mappings': sequence_mappings
+        'sequence_mappings': _sequence_mappings_payload()
     }
 
 @router.get("/permission")
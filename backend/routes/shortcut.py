@@ -8,14 +8,14 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from pynput.keyboard import Key, Controller
-import re
 import sys
 import os
 
 # 添加utils目录到路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import info, error
-from utils.platform_utils import get_platform, CURRENT_PLATFORM, MODIFIER_KEY_MAP
+from utils.platform_utils import get_platform, CURRENT_PLATFORM, MODIFIER_KEY_MAP, SHORTCUT_PATTERN
+from utils.license_manager import check_activation
 
 # 创建路由器实例
 router = APIRouter()
@@ -148,8 +148,7 @@ def parse_shortcut(shortcut_str):
     shortcut_str = shortcut_str.strip().lower()
     
     # 验证格式：必须是小写字母、数字和下划线，用+分隔
-    pattern = r'^[a-z0-9_]+(\+[a-z0-9_]+)*$'
-    if not re.match(pattern, shortcut_str):
+    if not SHORTCUT_PATTERN.fullmatch(shortcut_str):
         raise ValueError(f"快捷键格式不正确，必须使用小写字母、数字和下划线，用+分隔，例如：ctrl+v，当前输入：{shortcut_str}")
     
     parts = shortcut_str.split('+')
@@ -225,7 +224,6 @@ async def execute_shortcut_endpoint(request: ShortcutRequest):
     """执行键盘快捷键"""
     try:
         # === 激活检查开始 ===
-        from ..utils.license_manager import check_activation
         if not check_activation():
             raise HTTPException(
                 status_code=403,
@@ -251,10 +249,10 @@ async def execute_shortcut_endpoint(request: ShortcutRequest):
         
         info(f"快捷键执行成功: {shortcut_str}", "shortcut")
         
-        return ShortcutResponse(
-            status="success",
-            message="快捷键执行成功"
-        )
+        return {
+            "status": "success",
+            "message": "快捷键执行成功"
+        }
     except ValueError as e:
         error(f"快捷键执行失败 (ValueError): {str(e)}", "shortcut")
         raise HTTPException(
@@ -7,6 +7,7 @@
 在Mac上完成操作
 """
 
+import functools
 import hashlib
 import base64
 import time
@@ -204,6 +205,20 @@ class ActivationKeyValidator:
         返回:
             (is_valid, error_message) 验证结果和错误信息
         """
+        is_valid, error_msg, _ = self.validate_activation_code_with_expiry(machine_code, activation_code)
+        return is_valid, error_msg
+    
+    def validate_activation_code_with_expiry(self, machine_code: str, activation_code: str) -> Tuple[bool, Optional[str], Optional[int]]:
+        """
+        验证激活码并返回有效期
+        
+        参数:
+            machine_code: 机器码
+            activation_code: 激活码
+            
+        返回:
+            (is_valid, error_message, expiry) 验证结果、错误信息和过期时间戳（验证失败时为None）
+        """
         try:
             # 1. 移除格式化字符
             clean_code = activation_code.replace('-', '')
@@ -214,7 +229,7 @@ class ActivationKeyValidator:
             # 3. 分离加密的密钥和数据
             parts = combined.split(b'|')
             if len(parts) != 2:
-                return False, "Invalid activation code format"
+                return False, "Invalid activation code format", None
             
             encrypted_key, encrypted_data = parts
             
@@ -231,30 +246,30 @@ class ActivationKeyValidator:
             # 5. 使用AES解密数据
             decrypted_data = self._aes_decrypt(encrypted_data, aes_key)
             
-            # 6. 解析JSON数据
-            activation_data = json.loads(decrypted_data.decode())
+            # 6. 解析JSON数据（json.loads 直接接受UTF-8字节，无需先解码）
+            activation_data = json.loads(decrypted_data)
             
             # 7. 验证机器码
             if activation_data['mc'] != machine_code:
-                return False, "Machine code mismatch"
+                return False, "Machine code mismatch", None
             
             # 8. 验证哈希
-            hash1 = hashlib.sha256(decrypted_data.decode().encode()).hexdigest()
+            hash1 = hashlib.sha256(decrypted_data).hexdigest()
             hash2 = hashlib.sha384(hash1.encode()).hexdigest()
             expected_hash = hash1[:32] + hash2[:32]
             
             if activation_data['hash'] != expected_hash:
-                return False, "Invalid activation code signature"
+                return False, "Invalid activation code signature", None
             
             # 9. 验证有效期
             current_time = int(time.time())
             if current_time > activation_data['exp']:
-                return False, "Activation code has expired"
+                return False, "Activation code has expired", None
             
-            return True, None
+            return True, None, activation_data['exp']
             
         except Exception as e:
-            return False, f"Validation error: {str(e)}"
+            return False, f"Validation error: {str(e)}", None
     
     def _aes_decrypt(self, encrypted_data: bytes, key: bytes) -> bytes:
         """
@@ -296,10 +311,13 @@ hQIDAQAB
 -----END PUBLIC KEY-----"""
 
 
+@functools.lru_cache(maxsize=1)
 def get_builtin_validator() -> ActivationKeyValidator:
     """
     获取内置的验证器实例
     
+    公钥只在首次调用时解析，之后复用同一个验证器
+    
     返回:
         ActivationKeyValidator实例
     """
@@ -321,10 +339,26 @@ def validate_builtin_activation_code(machine_code: str, activation_code: str) ->
     return validator.validate_activation_code(machine_code, activation_code)
 
 
+def validate_builtin_activation_code_with_expiry(machine_code: str, activation_code: str) -> Tuple[bool, Optional[str], Optional[int]]:
+    """
+    使用内置公钥验证激活码并返回有效期
+    
+    参数:
+        machine_code: 机器码
+        activation_code: 激活码
+        
+    返回:
+        (is_valid, error_message, expiry) 验证结果、错误信息和过期时间戳
+    """
+    validator = get_builtin_validator()
+    return validator.validate_activation_code_with_expiry(machine_code, activation_code)
+
+
 __all__ = [
     'ActivationKeyGenerator',
     'ActivationKeyValidator',
     'BUILTIN_PUBLIC_KEY',
     'get_builtin_validator',
     'validate_builtin_activation_code',
+    'validate_builtin_activation_code_with_expiry',
 ]
\ No newline at end of file
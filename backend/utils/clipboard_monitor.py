@@ -29,6 +29,11 @@ class ClipboardMonitor:
         self._lock: threading.Lock = threading.Lock()
         self._platform: str = 'mac'  # Mac专用
         self._screenshot_dir: str = str(Path.home() / "Desktop")  # Mac 默认截图位置
+        # Mac 截图文件名格式: "Screenshot*.png" 或 "屏幕截图*.png"（轮询时直接使用，无需每次拼接）
+        self._screenshot_patterns: List[str] = [
+            os.path.join(self._screenshot_dir, "Screenshot*.png"),
+            os.path.join(self._screenshot_dir, "屏幕截图*.png"),
+        ]
     
     def _get_clipboard_content(self) -> Optional[bytes]:
         """获取剪贴板内容（支持文本和图片）"""
@@ -55,14 +60,8 @@ class ClipboardMonitor:
     def _get_latest_screenshot_time(self) -> float:
         """获取最新截图文件的修改时间"""
         try:
-            # Mac 截图文件名格式: "Screenshot*.png" 或 "屏幕截图*.png"
-            patterns = [
-                os.path.join(self._screenshot_dir, "Screenshot*.png"),
-                os.path.join(self._screenshot_dir, "屏幕截图*.png"),
-            ]
-            
             latest_time = 0.0
-            for pattern in patterns:
+            for pattern in self._screenshot_patterns:
                 files = glob.glob(pattern)
                 for f in files:
                     try:
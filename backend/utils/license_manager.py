@@ -12,14 +12,14 @@ import json
 import hashlib
 import base64
 import time
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 import threading
 
-from .activation import validate_builtin_activation_code
+from .activation import validate_builtin_activation_code_with_expiry
 from .machine_id import get_machine_code
 
 
@@ -31,8 +31,12 @@ class LicenseManager:
         self._lock = threading.Lock()
         self._is_activated = None
         self._activation_code = None
+        self._expires_at = None  # 激活码过期时间戳（验证通过时记录，之后只需比较时间）
+        self._license_cache = None  # ((修改时间, 文件大小), 许可证数据)
         self._license_file = self._get_license_file_path()
         self._encryption_key = self._get_encryption_key()
+        # 密钥在进程内不变，加解密复用同一个 Fernet 实例
+        self._fernet = Fernet(base64.urlsafe_b64encode(self._encryption_key))
         
     def _get_license_file_path(self) -> str:
         """
@@ -47,8 +51,7 @@ class LicenseManager:
         else:  # macOS/Linux
             license_dir = os.path.join(os.path.expanduser('~'), '.kpsr')
         
-        if not os.path.exists(license_dir):
-            os.makedirs(license_dir, exist_ok=True)
+        os.makedirs(license_dir, exist_ok=True)
         
         # 使用隐藏文件名
         return os.path.join(license_dir, '.license')
@@ -86,23 +89,21 @@ class LicenseManager:
         返回:
             Base64编码的加密数据
         """
-        fernet = Fernet(base64.urlsafe_b64encode(self._encryption_key))
-        encrypted = fernet.encrypt(data.encode())
+        encrypted = self._fernet.encrypt(data.encode())
         return base64.urlsafe_b64encode(encrypted).decode()
     
-    def _decrypt_data(self, encrypted_data: str) -> str:
+    def _decrypt_data(self, encrypted_data: Union[str, bytes]) -> str:
         """
         解密数据
         
         参数:
-            encrypted_data: Base64编码的加密数据
+            encrypted_data: Base64编码的加密数据（字符串或ASCII字节）
             
         返回:
             解密后的字符串
         """
         try:
-            fernet = Fernet(base64.urlsafe_b64encode(self._encryption_key))
-            decrypted = fernet.decrypt(base64.urlsafe_b64decode(encrypted_data))
+            decrypted = self._fernet.decrypt(base64.urlsafe_b64decode(encrypted_data))
             return decrypted.decode()
         except Exception:
             raise ValueError("Invalid encrypted data")
@@ -115,14 +116,26 @@ class LicenseManager:
             许可证数据字典，如果加载失败则返回None
         """
         try:
-            if not os.path.exists(self._license_file):
+            # 一次 stat 同时判断文件是否存在并取得缓存校验信息
+            try:
+                stat = os.stat(self._license_file)
+            except FileNotFoundError:
                 return None
             
-            with open(self._license_file, 'r', encoding='utf-8') as f:
+            # 文件未变化时直接返回缓存，避免重复读取和解密
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._license_cache
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            
+            # 许可证内容是ASCII的Base64，按字节读取，无需文本解码
+            with open(self._license_file, 'rb') as f:
                 encrypted_data = f.read().strip()
             
             decrypted_data = self._decrypt_data(encrypted_data)
-            return json.loads(decrypted_data)
+            license_data = json.loads(decrypted_data)
+            self._license_cache = (signature, license_data)
+            return license_data
         except Exception:
             return None
     
@@ -140,9 +153,19 @@ class LicenseManager:
             data_str = json.dumps(license_data, separators=(',', ':'))
             encrypted_data = self._encrypt_data(data_str)
             
-            with open(self._license_file, 'w', encoding='utf-8') as f:
-                f.write(encrypted_data)
+            # 以 0o600 权限创建文件（仅当前用户可读写），一次写入编码后的字节
+            fd = os.open(
+                self._license_file,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+                0o600
+            )
+            with os.fdopen(fd, 'wb') as f:
+                # os.open 只在新建文件时设置权限，已存在的文件需要单独收紧（POSIX）
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(f.fileno(), 0o600)
+                f.write(encrypted_data.encode('ascii'))
             
+            self._license_cache = None
             return True
         except Exception:
             return False
@@ -163,7 +186,7 @@ class LicenseManager:
                 machine_code = get_machine_code()
                 
                 # 验证激活码
-                is_valid, error_msg = validate_builtin_activation_code(machine_code, activation_code)
+                is_valid, error_msg, expiry = validate_builtin_activation_code_with_expiry(machine_code, activation_code)
                 if not is_valid:
                     return False, error_msg or "Invalid activation code"
                 
@@ -176,8 +199,10 @@ class LicenseManager:
                 }
                 
                 if self._save_license(license_data):
-                    self._is_activated = True
+                    # 先写有效期再写激活标志，锁外的快速路径不会读到新标志配旧有效期
+                    self._expires_at = expiry
                     self._activation_code = activation_code
+                    self._is_activated = True
                     return True, "Activation successful"
                 else:
                     return False, "Failed to save license"
@@ -194,10 +219,14 @@ class LicenseManager:
         """
         with self._lock:
             try:
-                if os.path.exists(self._license_file):
+                try:
                     os.remove(self._license_file)
+                except FileNotFoundError:
+                    pass
+                self._license_cache = None
                 self._is_activated = False
                 self._activation_code = None
+                self._expires_at = None
                 return True
             except Exception:
                 return False
@@ -209,6 +238,21 @@ class LicenseManager:
         返回:
             是否已激活
         """
+        # 快速路径：已有缓存结果时无需加锁（每个受保护的接口请求都会调用）
+        cached = self._is_activated
+        if cached is not None:
+            expires_at = self._expires_at
+            if cached and expires_at is not None and time.time() > expires_at:
+                # 激活码已过期，缓存的激活状态失效
+                with self._lock:
+                    # 有效期未变才失效，期间可能已用新激活码重新激活
+                    if self._expires_at == expires_at:
+                        self._is_activated = False
+                        self._activation_code = None
+                        return False
+                return self.is_activated()
+            return cached
+        
         with self._lock:
             if self._is_activated is not None:
                 return self._is_activated
@@ -229,9 +273,10 @@ class LicenseManager:
                     return False
                 
                 # 验证激活码
-                is_valid, _ = validate_builtin_activation_code(machine_code, activation_code)
-                self._is_activated = is_valid
+                is_valid, _, expiry = validate_builtin_activation_code_with_expiry(machine_code, activation_code)
+                self._expires_at = expiry
                 self._activation_code = activation_code if is_valid else None
+                self._is_activated = is_valid
                 
                 return is_valid
             except Exception:
@@ -245,10 +290,11 @@ class LicenseManager:
         返回:
             激活信息字典，如果未激活则返回None
         """
+        # 先在锁外检查激活状态（is_activated 自身会加锁，嵌套获取会死锁）
+        if not self.is_activated():
+            return None
+        
         with self._lock:
-            if not self.is_activated():
-                return None
-            
             license_data = self._load_license()
             if license_data:
                 # 移除敏感信息
@@ -291,6 +337,10 @@ def get_license_manager() -> LicenseManager:
     """
     global _license_manager
     
+    # 快速路径：实例已创建时无需加锁
+    if _license_manager is not None:
+        return _license_manager
+    
     with _manager_lock:
         if _license_manager is None:
             _license_manager = LicenseManager()
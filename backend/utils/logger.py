@@ -11,9 +11,12 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import threading
 import shutil
+import atexit
+import time
+import orjson
 
 # 导入统一配置
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -32,6 +35,43 @@ log_lock = threading.Lock()
 MAX_LOG_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_LOG_FILES = 5  # 保留最多5个日志文件
 MAX_JSON_LOGS = 10000  # JSON日志最多保留10000条
+JSON_FLUSH_INTERVAL = 2.0  # JSON日志批量写入间隔（秒）
+
+def _load_json_file(path: Path) -> Any:
+    """读取JSON文件"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _serialize_json(data: Any) -> bytes:
+    """序列化为JSON字节（格式与 json.dump(indent=2) 一致）"""
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    except TypeError:
+        # orjson 不支持的数据（如超过64位的整数）交给标准库处理
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _is_json_serializable(data: Any) -> bool:
+    """检查数据能否序列化为JSON"""
+    try:
+        _serialize_json(data)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def _dump_json_file(path: Path, data: Any) -> None:
+    """写入JSON文件"""
+    # 先序列化再写文件，序列化失败时原文件保持不变
+    content = _serialize_json(data)
+    
+    # 写入临时文件后原子替换，避免中途失败留下空文件
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
 
 class AppLogger:
     """应用日志管理器"""
@@ -41,6 +81,15 @@ class AppLogger:
         self.log_file = LOGS_DIR / f"{name}.log"
         self.json_log_file = LOGS_DIR / f"{name}.json"
         
+        # 待写入的JSON日志条目（由后台线程定期批量写入，避免每条日志都重写整个文件）
+        self._pending_json: List[Dict[str, Any]] = []
+        self._flush_thread: Optional[threading.Thread] = None
+        
+        # 内存中的JSON日志（首次读取后与文件保持同步，避免每次查询都重新解析文件）
+        self._json_logs: Optional[List[Dict[str, Any]]] = None
+        self._json_version: int = 0  # JSON日志每次变更时递增
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None  # (版本号, 统计结果)
+        
         # 配置Python logging
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
@@ -70,13 +119,15 @@ class AppLogger:
         
         # 初始化JSON日志文件
         self._init_json_log()
+        
+        # 退出时写入剩余的日志条目
+        atexit.register(self.flush)
     
     def _init_json_log(self) -> None:
         """初始化JSON日志文件"""
         try:
             if not self.json_log_file.exists():
-                with open(self.json_log_file, 'w', encoding='utf-8') as f:
-                    json.dump([], f)
+                _dump_json_file(self.json_log_file, [])
         except Exception as e:
             print(f"初始化JSON日志文件失败: {e}")
     
@@ -110,28 +161,73 @@ class AppLogger:
             print(f"日志文件轮转失败: {e}")
     
     def _append_json_log(self, entry: Dict[str, Any]) -> None:
-        """追加JSON日志条目"""
+        """追加JSON日志条目（先放入缓冲区，由后台线程批量写入）"""
+        with log_lock:
+            self._pending_json.append(entry)
+            
+            # 首次写日志时启动后台写入线程
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+                self._flush_thread.start()
+    
+    def _flush_loop(self) -> None:
+        """后台线程：定期将缓冲区中的日志写入JSON文件"""
+        while True:
+            time.sleep(JSON_FLUSH_INTERVAL)
+            self.flush()
+    
+    def _read_json_logs(self) -> List[Dict[str, Any]]:
+        """获取当前JSON日志列表（调用方需持有 log_lock；只在首次调用时读取文件）"""
+        if self._json_logs is None:
+            self._json_logs = _load_json_file(self.json_log_file)
+        return self._json_logs
+    
+    def flush(self) -> None:
+        """将缓冲区中的日志条目写入JSON文件"""
         with log_lock:
+            if not self._pending_json:
+                return
+            
             try:
                 # 读取现有日志
-                with open(self.json_log_file, 'r', encoding='utf-8') as f:
-                    logs = json.load(f)
-                
-                # 追加新条目
-                logs.append(entry)
-                
-                # 只保留最近的日志
-                if len(logs) > MAX_JSON_LOGS:
-                    logs = logs[-MAX_JSON_LOGS:]
-                
-                # 写回文件
-                with open(self.json_log_file, 'w', encoding='utf-8') as f:
-                    json.dump(logs, f, ensure_ascii=False, indent=2)
+                logs = self._read_json_logs()
             except json.JSONDecodeError as e:
                 print(f"JSON日志文件损坏，重新初始化: {e}")
-                self._init_json_log()
+                logs = []
+            except Exception as e:
+                print(f"读取JSON日志失败: {e}")
+                self._trim_pending_json()
+                return
+            
+            # 追加新条目（生成新列表，已返回给查询方的旧列表不受影响）
+            logs = logs + self._pending_json
+            
+            # 只保留最近的日志
+            if len(logs) > MAX_JSON_LOGS:
+                logs = logs[-MAX_JSON_LOGS:]
+            
+            try:
+                # 写回文件
+                _dump_json_file(self.json_log_file, logs)
+            except (TypeError, ValueError) as e:
+                # 丢弃无法序列化的条目，其余条目在下次写入时保存
+                print(f"JSON日志包含无法序列化的条目，已丢弃: {e}")
+                self._pending_json = [entry for entry in self._pending_json if _is_json_serializable(entry)]
+                return
             except Exception as e:
                 print(f"写入JSON日志失败: {e}")
+                self._trim_pending_json()
+                return
+            
+            # 写入成功后才更新内存状态
+            self._pending_json = []
+            self._json_logs = logs
+            self._json_version += 1
+    
+    def _trim_pending_json(self) -> None:
+        """写入失败时限制缓冲区大小，只保留最近的条目（调用方需持有 log_lock）"""
+        if len(self._pending_json) > MAX_JSON_LOGS:
+            self._pending_json = self._pending_json[-MAX_JSON_LOGS:]
     
     def _create_entry(
         self, 
@@ -211,9 +307,10 @@ class AppLogger:
                  start_time: Optional[str] = None,
                  end_time: Optional[str] = None) -> List[dict]:
         """获取日志"""
+        self.flush()
         try:
-            with open(self.json_log_file, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
+            with log_lock:
+                logs = self._read_json_logs()
             
             # 过滤
             if level:
@@ -245,9 +342,11 @@ class AppLogger:
                 with open(self.log_file, 'w', encoding='utf-8') as f:
                     f.write("")
                 
-                # 清空JSON日志
-                with open(self.json_log_file, 'w', encoding='utf-8') as f:
-                    json.dump([], f)
+                # 清空JSON日志（包括尚未写入的缓冲区）
+                self._pending_json = []
+                self._json_logs = []
+                self._json_version += 1
+                _dump_json_file(self.json_log_file, [])
                 
                 return True
             except Exception as e:
@@ -255,10 +354,14 @@ class AppLogger:
                 return False
     
     def get_log_stats(self) -> Dict[str, Any]:
-        """获取日志统计"""
+        """获取日志统计（日志未变化时直接返回缓存结果）"""
+        self.flush()
         try:
-            with open(self.json_log_file, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
+            with log_lock:
+                logs = self._read_json_logs()
+                version = self._json_version
+                if self._stats_cache is not None and self._stats_cache[0] == version:
+                    return self._stats_cache[1]
             
             stats = {
                 "total": len(logs),
@@ -275,6 +378,7 @@ class AppLogger:
                 stats["by_level"][level] = stats["by_level"].get(level, 0) + 1
                 stats["by_source"][source] = stats["by_source"].get(source, 0) + 1
             
+            self._stats_cache = (version, stats)
             return stats
         except json.JSONDecodeError as e:
             return {"error": f"JSON日志文件损坏: {e}"}
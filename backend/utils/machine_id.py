@@ -13,8 +13,19 @@ import hashlib
 import subprocess
 import re
 import uuid
+import threading
 from typing import Optional, List, Dict
 
+# 机器码缓存（硬件信息在进程运行期间不变，只需探测一次）
+_machine_code: Optional[str] = None
+_machine_code_lock = threading.Lock()
+
+# MAC地址格式（用于解析 getmac 输出）
+_MAC_PATTERN = re.compile(r'([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})', re.ASCII)
+
+# 机器码格式: XXXX-XXXX-XXXX-XXXX-XXXX-XXXX-XXXX-XXXX（预编译，整串匹配）
+_MACHINE_CODE_PATTERN = re.compile(r'[0-9A-F]{4}(-[0-9A-F]{4}){7}', re.ASCII)
+
 
 def get_cpu_id() -> Optional[str]:
     """
@@ -98,7 +109,7 @@ def get_mac_address() -> Optional[str]:
             # 解析MAC地址
             for line in output.split('\n'):
                 if '本地连接' in line or 'Ethernet' in line or 'Wi-Fi' in line:
-                    mac_match = re.search(r'([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})', line)
+                    mac_match = _MAC_PATTERN.search(line)
                     if mac_match:
                         mac = mac_match.group().replace('-', ':')
                         if not mac.startswith('00:00:00:00:00:00'):
@@ -199,12 +210,23 @@ def get_machine_code() -> str:
     """
     获取当前机器的唯一机器码
     
-    这是一个便捷函数，直接收集硬件信息并生成机器码
+    这是一个便捷函数，首次调用时收集硬件信息并生成机器码，之后返回缓存结果
+    （加锁保证并发调用时只执行一轮 wmic 等硬件查询命令）
     
     返回:
         32位的十六进制机器码，格式为XXXX-XXXX-XXXX-XXXX-XXXX-XXXX-XXXX-XXXX
     """
-    return generate_machine_code()
+    global _machine_code
+    
+    # 快速路径：已生成时无需加锁
+    if _machine_code is not None:
+        return _machine_code
+    
+    with _machine_code_lock:
+        if _machine_code is None:
+            _machine_code = generate_machine_code()
+    
+    return _machine_code
 
 
 def verify_machine_code(machine_code: str) -> bool:
@@ -217,9 +239,7 @@ def verify_machine_code(machine_code: str) -> bool:
     返回:
         True如果格式正确，False否则
     """
-    # 检查格式: XXXX-XXXX-XXXX-XXXX-XXXX-XXXX-XXXX-XXXX
-    pattern = r'^[0-9A-F]{4}(-[0-9A-F]{4}){7}$'
-    return bool(re.match(pattern, machine_code))
+    return _MACHINE_CODE_PATTERN.fullmatch(machine_code) is not None
 
 
 __all__ = [
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+网络工具模块
+提供私有网络地址判断功能
+"""
+
+import functools
+import ipaddress
+from typing import Optional
+
+# 私有网络地址段（按优先级排列，热点网络 10.x 优先）: (网络地址整数, 掩码整数)
+_PRIVATE_NETWORKS = tuple(
+    (int(net.network_address), int(net.netmask))
+    for net in (
+        ipaddress.ip_network("10.0.0.0/8"),      # 手机热点网络
+        ipaddress.ip_network("172.16.0.0/12"),   # 私有网络
+        ipaddress.ip_network("192.168.0.0/16"),  # 私有网络
+    )
+)
+
+# 本机回环地址段
+_LOOPBACK_NETWORK = ipaddress.ip_network("127.0.0.0/8")
+_LOOPBACK_INT = (int(_LOOPBACK_NETWORK.network_address), int(_LOOPBACK_NETWORK.netmask))
+
+
+def ip_to_int(ip: str) -> Optional[int]:
+    """将IPv4地址转换为32位整数，无效地址返回None"""
+    try:
+        return int(ipaddress.IPv4Address(ip))
+    except ValueError:
+        return None
+
+
+def private_network_rank(ip_int: int) -> Optional[int]:
+    """返回IP所在私有网络段的优先级（0 最高），不在私有网络段时返回None"""
+    for rank, (network, mask) in enumerate(_PRIVATE_NETWORKS):
+        if ip_int & mask == network:
+            return rank
+    return None
+
+
+# 客户端IP高度重复，按IP缓存判断结果
+@functools.lru_cache(maxsize=1024)
+def is_private_ip(ip: str) -> bool:
+    """检查IP是否在允许的网络范围内（只允许私有网络和本机访问）"""
+    if ip == 'localhost':
+        return True
+
+    ip_int = ip_to_int(ip)
+    if ip_int is None:
+        return False
+
+    network, mask = _LOOPBACK_INT
+    return ip_int & mask == network or private_network_rank(ip_int) is not None
+
+
+__all__ = [
+    'ip_to_int',
+    'private_network_rank',
+    'is_private_ip',
+]
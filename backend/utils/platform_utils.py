@@ -5,6 +5,8 @@
 Windows专用实现
 """
 
+import re
+
 from pynput.keyboard import Key
 
 # Windows专用常量
@@ -38,6 +40,9 @@ def get_modifier_key_map():
 # 预加载修饰键映射（避免每次调用都重新创建）
 MODIFIER_KEY_MAP = get_modifier_key_map()
 
+# 快捷键/鼠标操作格式：小写字母、数字和下划线，用+分隔（整串匹配）
+SHORTCUT_PATTERN = re.compile(r'[a-z0-9_]+(\+[a-z0-9_]+)*', re.ASCII)
+
 
 __all__ = [
     'get_platform',
@@ -47,4 +52,5 @@ __all__ = [
     'IS_MAC',
     'IS_LINUX',
     'MODIFIER_KEY_MAP',
+    'SHORTCUT_PATTERN',
 ]
@@ -10,6 +10,9 @@
 
 import subprocess
 import re
+import locale
+
+import psutil
 
 from utils.logger import app_logger
 
@@ -18,12 +21,51 @@ def kill_process_on_port(port: int) -> bool:
     """
     杀掉占用指定端口的进程（Windows专用）
     
+    优先使用 psutil 在进程内查询连接并结束进程，
+    psutil 无权查询连接时回退到 netstat/taskkill 命令
+    
     Args:
         port: 要清理的端口号
         
     Returns:
         bool: 成功返回True，失败返回False
     """
+    try:
+        pids = {
+            conn.pid
+            for conn in psutil.net_connections(kind='inet')
+            if conn.pid and conn.laddr and conn.laddr.port == port
+        }
+    except psutil.Error as e:
+        app_logger.warning(f"psutil 查询端口占用失败，改用命令行: {e}", "port_manager")
+        return _kill_process_on_port_by_command(port)
+    
+    return _kill_pids(port, pids)
+
+
+def _kill_pids(port: int, pids: set) -> bool:
+    """使用 psutil 结束占用端口的进程"""
+    if not pids:
+        app_logger.info(f"端口 {port} 未被占用", "port_manager")
+        return True
+    
+    for pid in pids:
+        app_logger.info(f"找到占用端口 {port} 的进程 PID: {pid}", "port_manager")
+        try:
+            psutil.Process(pid).kill()
+        except psutil.NoSuchProcess:
+            # 进程已退出，端口随之释放
+            pass
+        except psutil.Error as e:
+            app_logger.warning(f"杀掉进程失败: {e}", "port_manager")
+            return False
+        app_logger.info(f"成功杀掉进程 PID: {pid}", "port_manager")
+    
+    return True
+
+
+def _kill_process_on_port_by_command(port: int) -> bool:
+    """通过 netstat 和 taskkill 命令杀掉占用端口的进程"""
     try:
         # Windows: 使用 netstat 和 taskkill
         # 查找占用端口的进程
@@ -56,23 +98,27 @@ def kill_process_on_port(port: int) -> bool:
         
         # 去重PID
         unique_pids = list(set(pids))
-        
+        app_logger.info(f"找到占用端口 {port} 的进程 PID: {', '.join(unique_pids)}", "port_manager")
+
+        # 杀掉进程：taskkill 支持多个 /PID 参数，一次调用结束全部进程
+        kill_cmd = ['taskkill', '/F']
         for pid in unique_pids:
-            app_logger.info(f"找到占用端口 {port} 的进程 PID: {pid}", "port_manager")
-            # 杀掉进程
-            kill_result = subprocess.run(
-                ['taskkill', '/F', '/PID', pid],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                shell=True
-            )
-            if kill_result.returncode == 0:
-                app_logger.info(f"成功杀掉进程 PID: {pid}", "port_manager")
-            else:
-                app_logger.warning(f"杀掉进程失败: {kill_result.stderr}", "port_manager")
-                return False
-        
+            kill_cmd += ['/PID', pid]
+
+        # 成功时的输出不需要，只保留 stderr 并在失败时才解码
+        kill_result = subprocess.run(
+            kill_cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=5,
+            shell=True
+        )
+        if kill_result.returncode != 0:
+            stderr = kill_result.stderr.decode(locale.getpreferredencoding(False), errors='replace')
+            app_logger.warning(f"杀掉进程失败: {stderr}", "port_manager")
+            return False
+
+        app_logger.info(f"成功杀掉进程 PID: {', '.join(unique_pids)}", "port_manager")
         return True
             
     except subprocess.TimeoutExpired:
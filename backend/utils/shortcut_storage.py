@@ -182,6 +182,10 @@ def update_button(button_id: str, button_data: Dict) -> Optional[Dict]:
                 if 'toggleActions' not in updated_button:
                     updated_button['toggleActions'] = {}
             
+            # 除 updated_at 外内容没有变化时直接返回，不重写配置文件
+            if {**updated_button, "updated_at": button.get("updated_at")} == button:
+                return button
+            
             buttons[i] = updated_button
             save_buttons(buttons)
             